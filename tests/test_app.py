@@ -4,96 +4,57 @@ Test suite for the Mergington High School Activity Management API
 Tests cover all API endpoints and their error handling.
 """
 
+import copy
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from fastapi.testclient import TestClient
-from app import app
+from app import app, activities
 
 
-@pytest.fixture
+# Pre-encoded endpoint paths used throughout the tests
+CHESS_SIGNUP = "/activities/Chess%20Club/signup"
+CHESS_UNREGISTER = "/activities/Chess%20Club/unregister"
+TENNIS_SIGNUP = "/activities/Tennis%20Club/signup"
+ART_SIGNUP = "/activities/Art%20Studio/signup"
+GYM_SIGNUP = "/activities/Gym%20Class/signup"
+ROBOTICS_UNREGISTER = "/activities/Robotics%20Club/unregister"
+PROGRAMMING_SIGNUP = "/activities/Programming%20Class/signup"
+PROGRAMMING_UNREGISTER = "/activities/Programming%20Class/unregister"
+FAKE_SIGNUP = "/activities/Fake%20Activity/signup"
+FAKE_UNREGISTER = "/activities/Fake%20Activity/unregister"
+MULTI_SIGNUP_PATHS = [CHESS_SIGNUP, "/activities/Drama%20Club/signup", TENNIS_SIGNUP]
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared across the session"""
+    # Entering the client runs the app's startup/shutdown handlers exactly once
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Snapshot of the seed data in app.py, taken before any test mutates it
+_SNAPSHOT = copy.deepcopy(activities)
+
+
+def _restore_activities():
+    activities.clear()
+    activities.update(copy.deepcopy(_SNAPSHOT))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def restore_activities_at_session_end():
+    """Leave activities in their initial state once the whole session is done"""
+    yield
+    _restore_activities()
 
 
 @pytest.fixture
 def reset_activities():
     """Reset activities to initial state before each test"""
-    from app import activities
-    
-    # Store original state
-    original_state = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and games",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn tennis skills and compete in matches",
-            "schedule": "Tuesdays and Saturdays, 3:00 PM - 4:30 PM",
-            "max_participants": 10,
-            "participants": ["james@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act in plays and develop theatrical performance skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and sculpture",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["mia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 16,
-            "participants": ["noah@mergington.edu", "ava@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Design and build robots for competitions",
-            "schedule": "Tuesdays, Thursdays, and Saturdays, 4:00 PM - 5:30 PM",
-            "max_participants": 14,
-            "participants": ["ethan@mergington.edu"]
-        }
-    }
-    
-    # Clear activities
-    activities.clear()
-    # Restore original state
-    activities.update(original_state)
-    
+    # Every test resets on setup, so no per-test teardown is needed
+    _restore_activities()
     yield
-    
-    # Restore after test
-    activities.clear()
-    activities.update(original_state)
 
 
 class TestGetActivities:
@@ -139,7 +100,7 @@ class TestSignupForActivity:
     def test_signup_new_participant_successfully(self, client, reset_activities):
         """Test successfully signing up a new participant"""
         response = client.post(
-            "/activities/Chess%20Club/signup",
+            CHESS_SIGNUP,
             params={"email": "newstudent@mergington.edu"}
         )
         
@@ -152,52 +113,26 @@ class TestSignupForActivity:
         """Test that signed up participant appears in activity"""
         # Sign up a new participant
         client.post(
-            "/activities/Tennis%20Club/signup",
+            TENNIS_SIGNUP,
             params={"email": "newtennis@mergington.edu"}
         )
         
         # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert "newtennis@mergington.edu" in data["Tennis Club"]["participants"]
-    
-    def test_signup_duplicate_participant_fails(self, client, reset_activities):
-        """Test that duplicate signup is rejected"""
-        response = client.post(
-            "/activities/Chess%20Club/signup",
-            params={"email": "michael@mergington.edu"}
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_nonexistent_activity_fails(self, client, reset_activities):
-        """Test that signup to non-existent activity fails"""
-        response = client.post(
-            "/activities/Fake%20Activity/signup",
-            params={"email": "student@mergington.edu"}
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
+        assert "newtennis@mergington.edu" in activities["Tennis Club"]["participants"]
     
     def test_signup_increases_participant_count(self, client, reset_activities):
         """Test that signup increases the participant count"""
-        # Get initial count
-        response = client.get("/activities")
-        initial_count = len(response.json()["Art Studio"]["participants"])
+        # Initial count comes from the seed data restored by reset_activities
+        initial_count = len(_SNAPSHOT["Art Studio"]["participants"])
         
         # Sign up a new participant
         client.post(
-            "/activities/Art%20Studio/signup",
+            ART_SIGNUP,
             params={"email": "newartist@mergington.edu"}
         )
         
         # Check new count
-        response = client.get("/activities")
-        new_count = len(response.json()["Art Studio"]["participants"])
+        new_count = len(activities["Art Studio"]["participants"])
         
         assert new_count == initial_count + 1
 
@@ -208,7 +143,7 @@ class TestUnregisterFromActivity:
     def test_unregister_existing_participant_successfully(self, client, reset_activities):
         """Test successfully unregistering an existing participant"""
         response = client.delete(
-            "/activities/Chess%20Club/unregister",
+            CHESS_UNREGISTER,
             params={"email": "michael@mergington.edu"}
         )
         
@@ -221,95 +156,87 @@ class TestUnregisterFromActivity:
         """Test that unregistered participant no longer appears in activity"""
         # Unregister a participant
         client.delete(
-            "/activities/Robotics%20Club/unregister",
+            ROBOTICS_UNREGISTER,
             params={"email": "ethan@mergington.edu"}
         )
         
         # Verify participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert "ethan@mergington.edu" not in data["Robotics Club"]["participants"]
-    
-    def test_unregister_nonexistent_participant_fails(self, client, reset_activities):
-        """Test that unregistering a non-participating student fails"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister",
-            params={"email": "notregistered@mergington.edu"}
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"]
-    
-    def test_unregister_nonexistent_activity_fails(self, client, reset_activities):
-        """Test that unregistering from non-existent activity fails"""
-        response = client.delete(
-            "/activities/Fake%20Activity/unregister",
-            params={"email": "student@mergington.edu"}
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
+        assert "ethan@mergington.edu" not in activities["Robotics Club"]["participants"]
     
     def test_unregister_decreases_participant_count(self, client, reset_activities):
         """Test that unregister decreases the participant count"""
-        # Get initial count
-        response = client.get("/activities")
-        initial_count = len(response.json()["Chess Club"]["participants"])
+        # Initial count comes from the seed data restored by reset_activities
+        initial_count = len(_SNAPSHOT["Chess Club"]["participants"])
         
         # Unregister a participant
         client.delete(
-            "/activities/Chess%20Club/unregister",
+            CHESS_UNREGISTER,
             params={"email": "michael@mergington.edu"}
         )
         
         # Check new count
-        response = client.get("/activities")
-        new_count = len(response.json()["Chess Club"]["participants"])
+        new_count = len(activities["Chess Club"]["participants"])
         
         assert new_count == initial_count - 1
 
 
+class TestErrorResponses:
+    """Tests for error handling on the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("method,path,email,status,detail", [
+        ("post", FAKE_SIGNUP, "student@mergington.edu", 404, "Activity not found"),
+        ("delete", FAKE_UNREGISTER, "student@mergington.edu", 404, "Activity not found"),
+        ("post", CHESS_SIGNUP, "michael@mergington.edu", 400, "already signed up"),
+        ("delete", CHESS_UNREGISTER, "notregistered@mergington.edu", 400, "not signed up"),
+    ], ids=[
+        "signup_nonexistent_activity",
+        "unregister_nonexistent_activity",
+        "signup_duplicate_participant",
+        "unregister_nonexistent_participant",
+    ])
+    def test_request_fails_with_detail(self, client, reset_activities, method, path, email, status, detail):
+        """Test that invalid signup/unregister requests are rejected with a useful detail"""
+        response = getattr(client, method)(path, params={"email": email})
+        
+        assert response.status_code == status
+        data = response.json()
+        assert detail in data["detail"]
+
+
+@pytest.mark.slow
 class TestIntegrationScenarios:
     """Integration tests for complex scenarios"""
     
     def test_signup_then_unregister_participant(self, client, reset_activities):
         """Test signup followed by unregister"""
         email = "testuser@mergington.edu"
-        activity = "Programming%20Class"
         
         # Sign up
-        response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        response = client.post(PROGRAMMING_SIGNUP, params={"email": email})
         assert response.status_code == 200
         
         # Verify signup
-        response = client.get("/activities")
-        assert email in response.json()["Programming Class"]["participants"]
+        assert email in activities["Programming Class"]["participants"]
         
         # Unregister
-        response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
+        response = client.delete(PROGRAMMING_UNREGISTER, params={"email": email})
         assert response.status_code == 200
         
         # Verify unregister
-        response = client.get("/activities")
-        assert email not in response.json()["Programming Class"]["participants"]
+        assert email not in activities["Programming Class"]["participants"]
     
     def test_multiple_signups_different_activities(self, client, reset_activities):
         """Test signing up for multiple activities"""
         email = "multijoiner@mergington.edu"
-        activities = ["Chess%20Club", "Drama%20Club", "Tennis%20Club"]
         
         # Sign up for multiple activities
-        for activity in activities:
-            response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        for path in MULTI_SIGNUP_PATHS:
+            response = client.post(path, params={"email": email})
             assert response.status_code == 200
         
         # Verify all signups
-        response = client.get("/activities")
-        data = response.json()
         for activity_key in ["Chess Club", "Drama Club", "Tennis Club"]:
-            assert email in data[activity_key]["participants"]
+            assert email in activities[activity_key]["participants"]
     
     def test_signup_then_duplicate_signup_fails(self, client, reset_activities):
         """Test that duplicate signup is rejected after successful signup"""
@@ -317,14 +244,14 @@ class TestIntegrationScenarios:
         
         # First signup should succeed
         response = client.post(
-            "/activities/Gym%20Class/signup",
+            GYM_SIGNUP,
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Second signup with same email should fail
         response = client.post(
-            "/activities/Gym%20Class/signup",
+            GYM_SIGNUP,
             params={"email": email}
         )
         assert response.status_code == 400